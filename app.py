@@ -1,9 +1,16 @@
 import streamlit as st
-import pandas as pd
-import json
 import os
 from datetime import datetime
 
+try:
+    import orjson  # C-accelerated JSON for the save/load hot path
+except ImportError:
+    orjson = None
+
+# pandas and json are imported inside the functions that need them: they
+# are not required for the first paint, and sys.modules makes repeat
+# imports a dict lookup
+
 # Set page configuration
 st.set_page_config(
     page_title="University Application Tracker",
@@ -11,66 +18,194 @@ st.set_page_config(
     layout="wide"
 )
 
+# Requirement flags are packed into small ints: one bit per requirement.
+# Progress is then a popcount (int.bit_count) instead of a dict traversal.
+GENERAL_BITS = {
+    'GRE': 1 << 0,
+    'TOEFL': 1 << 1,
+    'Transcripts': 1 << 2,
+    'SOP': 1 << 3,
+    'Resume': 1 << 4,
+    'LORs': 1 << 5
+}
+
+# Checklist rows: (label, flag key) — add a requirement by adding a tuple
+# here and a bit in GENERAL_BITS
+GENERAL_REQS = [
+    ('GRE', 'GRE'),
+    ('TOEFL', 'TOEFL'),
+    ('Transcripts', 'Transcripts'),
+    ('Statement of Purpose', 'SOP'),
+    ('Resume', 'Resume'),
+    ('Letters of Recommendation', 'LORs')
+]
+# Widget keys precomputed once at import so reruns don't re-format them
+GENERAL_REQS = [(label, key, f'req_{key}') for label, key in GENERAL_REQS]
+
+UNIV_BITS = {
+    'Application_Started': 1 << 0,
+    'Documents_Uploaded': 1 << 1,
+    'Application_Submitted': 1 << 2,
+    'Fee_Paid': 1 << 3
+}
+
+# Display config for the applications table, built once at import time
+# instead of on every rerun
+COLUMN_CONFIG = {
+    "University": st.column_config.TextColumn("University", width=200),
+    "Requirements": st.column_config.TextColumn("Requirements", width=300),
+    "Expected_Qualities": st.column_config.TextColumn("Expected Qualities", width=300),
+    "Apply_Link": st.column_config.LinkColumn("Application Link", width=200),
+    "Program_Fee": st.column_config.TextColumn("Program Fee", width=200),
+    "Acceptance_Rate": st.column_config.TextColumn("Acceptance Rate", width=100),
+    "Program": st.column_config.TextColumn("Program", width=200),
+    # Hide the numeric helper columns; the formatted strings are shown
+    "Application_Fee_num": None,
+    "Tuition_Per_Year_num": None,
+    "Living_Costs_Yearly_num": None,
+    "Total_Cost_2Years_num": None,
+    "Avg_Starting_Salary_num": None,
+    "ROI_5Year_num": None
+}
+
+# Editable per-university status table (one data_editor instead of a
+# widget per checkbox)
+STATUS_COLUMN_CONFIG = {
+    "Application_Started": st.column_config.CheckboxColumn("Application Started"),
+    "Documents_Uploaded": st.column_config.CheckboxColumn("Documents Uploaded"),
+    "Application_Submitted": st.column_config.CheckboxColumn("Application Submitted"),
+    "Fee_Paid": st.column_config.CheckboxColumn("Fee Paid"),
+    "Progress": st.column_config.ProgressColumn("Progress", min_value=0, max_value=100, format="%d%%")
+}
+
+def set_flag(flags, bit, checked):
+    # Set or clear a single bit in a flag word
+    return flags | bit if checked else flags & ~bit
+
+def unpack_legacy(requirements_checked):
+    # Convert the pre-bitmask dict-of-dicts save format into packed flags
+    general = 0
+    for key, bit in GENERAL_BITS.items():
+        if requirements_checked.get(key):
+            general |= bit
+    univ = {}
+    for name, fields in requirements_checked.get('University_Specific', {}).items():
+        flags = 0
+        for key, bit in UNIV_BITS.items():
+            if fields.get(key):
+                flags |= bit
+        univ[name] = flags
+    return general, univ
+
+def state_hash():
+    import json
+
+    # Hash of the persisted state (timestamp excluded) for dirty tracking
+    return hash(json.dumps(
+        {'g': st.session_state.general_flags, 'u': st.session_state.univ_flags},
+        sort_keys=True
+    ))
+
 # Function to save progress
 def save_progress():
+    # Skip the serialize+write entirely when nothing changed since the
+    # last save or load
+    current_hash = state_hash()
+    if current_hash == st.session_state.get('_saved_hash'):
+        st.success('Progress saved successfully! ✅')
+        return
+
     progress_data = {
-        'requirements_checked': st.session_state.requirements_checked,
+        'g': st.session_state.general_flags,      # packed general requirements
+        'u': st.session_state.univ_flags,         # packed per-university flags
         'last_updated': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
-    
+
     try:
-        # Create a progress folder if it doesn't exist
-        if not os.path.exists('progress'):
-            os.makedirs('progress')
-            
-        # Save the progress data
-        with open('progress/application_progress.json', 'w') as f:
-            json.dump(progress_data, f)
+        # exist_ok skips the separate existence probe
+        os.makedirs('progress', exist_ok=True)
+
+        # Serialize to bytes first and issue a single buffered write,
+        # rather than letting json.dump emit many small writes
+        if orjson is not None:
+            payload = orjson.dumps(progress_data)
+        else:
+            import json
+            payload = json.dumps(progress_data, separators=(',', ':'), ensure_ascii=False).encode()
+        with open('progress/application_progress.json', 'wb', buffering=1 << 16) as f:
+            f.write(payload)
+        st.session_state._saved_hash = current_hash
         st.success('Progress saved successfully! ✅')
     except Exception as e:
         st.error(f'Error saving progress: {str(e)}')
 
 # Initialize session state and load saved progress if available
-if 'requirements_checked' not in st.session_state:
-    # Default initial state
-    st.session_state.requirements_checked = {
-        'GRE': False,
-        'TOEFL': False,
-        'Transcripts': False,
-        'SOP': False,
-        'Resume': False,
-        'LORs': False,
-        'University_Specific': {}  # For university-specific requirements
-    }
-    
+if 'general_flags' not in st.session_state:
+    # Default initial state: nothing checked yet
+    st.session_state.general_flags = 0
+    st.session_state.univ_flags = {}  # University name -> packed flags
+
     # Try to load saved progress
     try:
         if os.path.exists('progress/application_progress.json'):
-            with open('progress/application_progress.json', 'r') as f:
-                progress_data = json.load(f)
-                st.session_state.requirements_checked = progress_data['requirements_checked']
+            with open('progress/application_progress.json', 'rb') as f:
+                raw = f.read()
+                if orjson is not None:
+                    progress_data = orjson.loads(raw)
+                else:
+                    import json
+                    progress_data = json.loads(raw)
+                if 'requirements_checked' in progress_data:
+                    # Save file from before the packed-flag format: migrate
+                    # it rather than discarding the user's progress. The
+                    # saved hash is left unset so the next save rewrites
+                    # the file in the current format.
+                    general, univ = unpack_legacy(progress_data['requirements_checked'])
+                    st.session_state.general_flags = general
+                    st.session_state.univ_flags = univ
+                else:
+                    st.session_state.general_flags = progress_data['g']
+                    st.session_state.univ_flags = progress_data['u']
+                    st.session_state._saved_hash = state_hash()
                 st.success(f'Progress loaded! Last saved: {progress_data["last_updated"]} ✅')
     except Exception as e:
         st.error(f'Error loading saved progress: {str(e)}')
 
+@st.cache_data(show_spinner=False)
+def format_university_data(df):
+    # Ensure proper formatting of monetary values
+    money_columns = ['Application_Fee', 'Tuition_Per_Year', 'Living_Costs_Yearly',
+                    'Total_Cost_2Years', 'Avg_Starting_Salary', 'ROI_5Year']
+    for col in money_columns:
+        # Strip $ and , in a single regex pass and keep the numeric values
+        # alongside the display strings (hidden in the table)
+        numeric = df[col].str.replace(r'[$,]', '', regex=True).astype('float64')
+        df[col + '_num'] = numeric
+        df[col] = numeric.map('${:,.0f}'.format)
+
+    # Ensure percentage formatting
+    percentage_columns = ['Acceptance_Rate', 'Placement_Rate']
+    for col in percentage_columns:
+        df[col] = df[col].str.rstrip('%') + '%'
+
+    # Categorical dtype so the filter path can compare small integer codes
+    # instead of hashing object strings
+    df['Category'] = df['Category'].astype('category')
+    df['Program'] = df['Program'].astype('category')
+
+    return df
+
+@st.cache_data(show_spinner=False)
 def load_university_data():
+    import pandas as pd
+
     try:
-        # Read the CSV file
-        df = pd.read_csv('data.csv')
-        
-        # Ensure proper formatting of monetary values
-        money_columns = ['Application_Fee', 'Tuition_Per_Year', 'Living_Costs_Yearly', 
-                        'Total_Cost_2Years', 'Avg_Starting_Salary', 'ROI_5Year']
-        for col in money_columns:
-            df[col] = df[col].str.replace('$', '').str.replace(',', '')\
-                            .astype(float).apply(lambda x: f"${x:,.0f}")
-        
-        # Ensure percentage formatting
-        percentage_columns = ['Acceptance_Rate', 'Placement_Rate']
-        for col in percentage_columns:
-            df[col] = df[col].str.rstrip('%') + '%'
-        
-        return df
+        # Read the Parquet file (generated from data.csv via
+        # pd.read_csv('data.csv').to_parquet('data.parquet', compression='zstd'))
+        df = pd.read_parquet('data.parquet')
+
+        # Format the raw data (cached separately so a cache hit does no pandas work)
+        return format_university_data(df)
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         return pd.DataFrame()  # Return empty DataFrame if there's an error
@@ -86,25 +221,40 @@ df = load_university_data()
 # Sidebar filters
 st.sidebar.header('Filters')
 
+# Compute the option lists once; .cat.categories is an O(1) attribute
+cat_opts = df['Category'].cat.categories.tolist()
+prog_opts = df['Program'].cat.categories.tolist()
+
 # Category filter
 selected_categories = st.sidebar.multiselect(
     'Select Application Category',
-    options=df['Category'].unique(),
-    default=df['Category'].unique()
+    options=cat_opts,
+    default=cat_opts
 )
 
 # Program filter
 selected_programs = st.sidebar.multiselect(
     'Select Programs',
-    options=df['Program'].unique(),
-    default=df['Program'].unique()
+    options=prog_opts,
+    default=prog_opts
 )
 
-# Filter the dataframe
-filtered_df = df[
-    df['Category'].isin(selected_categories) &
-    df['Program'].isin(selected_programs)
-]
+# Filter the dataframe on the integer category codes. Fast path: when
+# nothing is deselected (the default view) the filter is a no-op, so skip
+# the mask construction and DataFrame copy entirely.
+cat_all = len(selected_categories) == len(cat_opts)
+prog_all = len(selected_programs) == len(prog_opts)
+if cat_all and prog_all:
+    filtered_df = df
+else:
+    mask = True
+    if not cat_all:
+        cat_codes = df['Category'].cat.categories.get_indexer(selected_categories)
+        mask = df['Category'].cat.codes.isin(cat_codes)
+    if not prog_all:
+        prog_codes = df['Program'].cat.categories.get_indexer(selected_programs)
+        mask = mask & df['Program'].cat.codes.isin(prog_codes)
+    filtered_df = df[mask]
 
 # Progress Tracking Section
 st.header('Application Progress')
@@ -115,17 +265,15 @@ with col1:
     st.subheader('Requirements Checklist')
     requirements_cols = st.columns(3)
     
-    with requirements_cols[0]:
-        st.session_state.requirements_checked['GRE'] = st.checkbox('GRE', st.session_state.requirements_checked['GRE'])
-        st.session_state.requirements_checked['TOEFL'] = st.checkbox('TOEFL', st.session_state.requirements_checked['TOEFL'])
-    
-    with requirements_cols[1]:
-        st.session_state.requirements_checked['Transcripts'] = st.checkbox('Transcripts', st.session_state.requirements_checked['Transcripts'])
-        st.session_state.requirements_checked['SOP'] = st.checkbox('Statement of Purpose', st.session_state.requirements_checked['SOP'])
-    
-    with requirements_cols[2]:
-        st.session_state.requirements_checked['Resume'] = st.checkbox('Resume', st.session_state.requirements_checked['Resume'])
-        st.session_state.requirements_checked['LORs'] = st.checkbox('Letters of Recommendation', st.session_state.requirements_checked['LORs'])
+    flags = st.session_state.general_flags
+    for i, (label, key, widget_key) in enumerate(GENERAL_REQS):
+        # Two requirements per column, keeping the original grouping
+        with requirements_cols[i // 2]:
+            bit = GENERAL_BITS[key]
+            flags = set_flag(flags, bit, st.checkbox(label, bool(flags & bit), key=widget_key))
+    # One session-state write at the end of the block, and only on change
+    if flags != st.session_state.general_flags:
+        st.session_state.general_flags = flags
 
     # Save and Load buttons
     save_col, load_col = st.columns(2)
@@ -134,12 +282,9 @@ with col1:
             save_progress()
 
 with col2:
-    # Calculate progress
-    general_reqs = sum(1 for key, val in st.session_state.requirements_checked.items() 
-                      if key != 'University_Specific' and val)
-    total_general_reqs = len(st.session_state.requirements_checked) - 1  # Subtract 1 for University_Specific
-    progress = general_reqs / total_general_reqs
-    
+    # Calculate progress: one popcount instead of a dict traversal
+    progress = st.session_state.general_flags.bit_count() / len(GENERAL_BITS)
+
     st.subheader('Overall Progress')
     st.progress(progress)
     st.write(f'{progress * 100:.0f}% Complete')
@@ -152,63 +297,55 @@ with st.container():
     # Display the filtered dataframe with a link column
     st.dataframe(
         filtered_df,
-        column_config={
-            "University": st.column_config.TextColumn("University", width=200),
-            "Requirements": st.column_config.TextColumn("Requirements", width=300),
-            "Expected_Qualities": st.column_config.TextColumn("Expected Qualities", width=300),
-            "Apply_Link": st.column_config.LinkColumn("Application Link", width=200),
-            "Program_Fee": st.column_config.TextColumn("Program Fee", width=200),
-            "Acceptance_Rate": st.column_config.TextColumn("Acceptance Rate", width=100),  # Add this line
-            "Program": st.column_config.TextColumn("Program", width=200)
-        },
+        column_config=COLUMN_CONFIG,
         hide_index=True,
         use_container_width=True
     )
-# University-specific requirements tracking
+# University-specific requirements tracking: one data_editor instead of an
+# expander + four checkboxes per university, so widget overhead stays O(1)
+# as the university list grows
 st.header('University-Specific Progress')
-for idx, row in filtered_df.iterrows():
-    university = row['University']
-    if university not in st.session_state.requirements_checked['University_Specific']:
-        st.session_state.requirements_checked['University_Specific'][university] = {
-            'Application_Started': False,
-            'Documents_Uploaded': False,
-            'Application_Submitted': False,
-            'Fee_Paid': False
-        }
-    
-    univ_progress = st.session_state.requirements_checked['University_Specific'][university]
-    
-    with st.expander(f"{university} Progress"):
-        cols = st.columns(4)
-        with cols[0]:
-            univ_progress['Application_Started'] = st.checkbox(
-                'Application Started',
-                univ_progress['Application_Started'],
-                key=f'start_{university}'
-            )
-        with cols[1]:
-            univ_progress['Documents_Uploaded'] = st.checkbox(
-                'Documents Uploaded',
-                univ_progress['Documents_Uploaded'],
-                key=f'docs_{university}'
-            )
-        with cols[2]:
-            univ_progress['Application_Submitted'] = st.checkbox(
-                'Application Submitted',
-                univ_progress['Application_Submitted'],
-                key=f'submit_{university}'
-            )
-        with cols[3]:
-            univ_progress['Fee_Paid'] = st.checkbox(
-                'Fee Paid',
-                univ_progress['Fee_Paid'],
-                key=f'fee_{university}'
-            )
-        
-        # Calculate university-specific progress
-        univ_progress_value = sum(univ_progress.values()) / len(univ_progress)
-        st.progress(univ_progress_value)
-        st.write(f'Progress: {univ_progress_value * 100:.0f}%')
+universities = filtered_df['University'].tolist()
+
+# Register unseen universities with one batched update instead of a
+# setdefault write per row
+missing = [u for u in universities if u not in st.session_state.univ_flags]
+if missing:
+    st.session_state.univ_flags.update(dict.fromkeys(missing, 0))
+
+import pandas as pd  # already in sys.modules from load_university_data
+
+univ_flags = st.session_state.univ_flags
+# dtype=bool keeps the columns boolean even when the filter leaves no
+# rows; otherwise pandas infers float64 and the checkbox config rejects it
+status_df = pd.DataFrame(
+    {
+        field: [bool(univ_flags[u] & bit) for u in universities]
+        for field, bit in UNIV_BITS.items()
+    },
+    index=universities,
+    dtype=bool
+)
+
+# Progress renders client-side as a bar; no per-row st.progress calls
+status_df['Progress'] = status_df[list(UNIV_BITS)].sum(axis=1) * 100 / len(UNIV_BITS)
+
+edited = st.data_editor(
+    status_df,
+    column_config=STATUS_COLUMN_CONFIG,
+    disabled=['Progress'],
+    use_container_width=True,
+    key='univ_status'
+)
+
+# Pack the edited booleans back into the bitmask dict in one pass
+packed = (edited[list(UNIV_BITS)] * list(UNIV_BITS.values())).sum(axis=1)
+new_flags = packed.to_dict()
+if any(univ_flags[u] != flags for u, flags in new_flags.items()):
+    univ_flags.update(new_flags)
+    # Re-render immediately: the Progress column above was computed from
+    # the pre-edit flags, so without this it lags one interaction behind
+    st.rerun()
 
 # Statistics
 st.header('Application Statistics')
@@ -216,16 +353,28 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.metric("Total Universities", len(filtered_df))
-    avg_fee = filtered_df['Application_Fee'].str.replace('$', '').astype(float).mean()
+    avg_fee = filtered_df['Application_Fee_num'].mean()
     st.metric("Average Application Fee", f"${avg_fee:.2f}")
 
 with col2:
-    st.metric("Self Apply Count", len(filtered_df[filtered_df['Category'] == 'Self Apply']))
-    st.metric("IDP Consultancy Count", len(filtered_df[filtered_df['Category'] == 'IDP Consultancy']))
+    # One scan of the Category column instead of a boolean mask per count
+    category_counts = filtered_df['Category'].value_counts()
+    st.metric("Self Apply Count", int(category_counts.get('Self Apply', 0)))
+    st.metric("IDP Consultancy Count", int(category_counts.get('IDP Consultancy', 0)))
 
 # Download section
 st.header('Download Data')
-csv = filtered_df.to_csv(index=False)
+
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(_df, categories, programs):
+    # _df is excluded from the cache key; the filter selection tuples
+    # identify the result, so checkbox reruns don't re-serialize.
+    # The *_num helper columns are display-side only — keep them out of
+    # the export
+    export_df = _df.drop(columns=[c for c in _df.columns if c.endswith('_num')])
+    return export_df.to_csv(index=False).encode()
+
+csv = to_csv_bytes(filtered_df, tuple(selected_categories), tuple(selected_programs))
 st.download_button(
     label="Download as CSV",
     data=csv,